@@ -2,33 +2,230 @@
 Data loading utilities for stock and news data.
 """
 import os
+import tempfile
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Optional, Tuple
+import pyarrow as pa
+from pyarrow import csv as pacsv
+from pyarrow import parquet as pq
 
 
-def load_stock_data(tickers: List[str], base_path: str = "../data/stock_data/") -> Dict[str, pd.DataFrame]:
+# Explicit Arrow types for the stock columns; other columns are inferred.
+# Files with UTC-offset dates or float volumes fall back to STOCK_FALLBACK_COLUMN_TYPES.
+STOCK_PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Adj Close']
+STOCK_FALLBACK_COLUMN_TYPES = {column: pa.float64() for column in STOCK_PRICE_COLUMNS}
+STOCK_COLUMN_TYPES = {
+    'Date': pa.timestamp('ns'),
+    **STOCK_FALLBACK_COLUMN_TYPES,
+    'Volume': pa.int64(),
+}
+
+# Publishers and tickers repeat heavily, so they are dictionary-encoded (categorical).
+# Dates mix UTC offsets, which Arrow cannot parse into one type, so they are read as text.
+NEWS_COLUMN_TYPES = {
+    'headline': pa.string(),
+    'url': pa.string(),
+    'publisher': pa.dictionary(pa.int32(), pa.string()),
+    'date': pa.string(),
+    'stock': pa.dictionary(pa.int32(), pa.string()),
+}
+
+# Bump when the parsed layout changes so existing Parquet caches are rebuilt
+CACHE_VERSION = "2"
+CACHE_VERSION_KEY = b"nova_cache_version"
+
+
+def _arrow_string_types(arrow_type: pa.DataType) -> Optional[pd.StringDtype]:
+    """
+    Keep Arrow string columns Arrow-backed when converting to pandas.
+    """
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return pd.StringDtype("pyarrow")
+    return None
+
+
+def _read_csv_arrow(csv_path: str,
+                    column_types: Optional[Dict[str, pa.DataType]] = None,
+                    parse_options: Optional[pacsv.ParseOptions] = None) -> pd.DataFrame:
+    """
+    Read a CSV file with the multi-threaded pyarrow CSV reader.
+    
+    Args:
+        csv_path: Path to the CSV file
+        column_types: Arrow types for known columns (others are inferred)
+        parse_options: Arrow CSV parse options (Arrow defaults if None)
+        
+    Returns:
+        DataFrame with the CSV contents
+    """
+    table = pacsv.read_csv(
+        csv_path,
+        read_options=pacsv.ReadOptions(use_threads=True, block_size=8 << 20),
+        parse_options=parse_options,
+        # Empty text fields are missing values, as with pd.read_csv
+        convert_options=pacsv.ConvertOptions(column_types=column_types or {},
+                                             strings_can_be_null=True),
+    )
+    df = table.to_pandas(types_mapper=_arrow_string_types, self_destruct=True)
+    # Name blank headers like pandas does ('Unnamed: 0', ...)
+    df.columns = [name or f"Unnamed: {i}" for i, name in enumerate(df.columns)]
+    return df
+
+
+def _read_news_csv(csv_path: str) -> pd.DataFrame:
+    """
+    Read the news CSV with compact column types and UTC dates.
+    
+    Args:
+        csv_path: Path to news data CSV file
+        
+    Returns:
+        DataFrame containing news data
+    """
+    # Headlines may contain quoted line breaks
+    news_df = _read_csv_arrow(
+        csv_path, NEWS_COLUMN_TYPES, pacsv.ParseOptions(newlines_in_values=True)
+    )
+    if 'date' in news_df.columns:
+        news_df['date'] = pd.to_datetime(news_df['date'], utc=True, format='ISO8601')
+    return news_df
+
+
+def _read_stock_csv(csv_path: str) -> pd.DataFrame:
+    """
+    Read a stock price CSV with explicit column types.
+    
+    Files whose dates carry UTC offsets or whose volumes are not integers
+    are re-read with those columns inferred, and the dates are normalized
+    with pd.to_datetime.
+    
+    Args:
+        csv_path: Path to the stock CSV file
+        
+    Returns:
+        DataFrame with the stock prices
+    """
+    try:
+        return _read_csv_arrow(csv_path, STOCK_COLUMN_TYPES)
+    except pa.ArrowInvalid:
+        df = _read_csv_arrow(csv_path, STOCK_FALLBACK_COLUMN_TYPES)
+    
+    if 'Date' in df.columns:
+        df['Date'] = pd.to_datetime(df['Date']).dt.as_unit('ns')
+    return df
+
+
+def _is_cache_valid(parquet_path: str, csv_path: str) -> bool:
+    """
+    Check that a Parquet cache is newer than its CSV and has the current version.
+    """
+    if not os.path.exists(parquet_path) or os.path.getmtime(parquet_path) < os.path.getmtime(csv_path):
+        return False
+    try:
+        metadata = pq.read_schema(parquet_path).metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        # Unreadable or truncated cache files are rebuilt
+        return False
+    return metadata.get(CACHE_VERSION_KEY) == CACHE_VERSION.encode()
+
+
+def _write_parquet_cache(df: pd.DataFrame, parquet_path: str) -> None:
+    """
+    Write a versioned Parquet cache atomically.
+    
+    The file is written to a temporary path in the same directory and moved
+    into place, so readers never see a partially written cache.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata(
+        {**(table.schema.metadata or {}), CACHE_VERSION_KEY: CACHE_VERSION.encode()}
+    )
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(parquet_path) or ".", suffix=".parquet.tmp"
+    )
+    os.close(fd)
+    try:
+        pq.write_table(table, tmp_path, compression="zstd")
+        os.replace(tmp_path, parquet_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _read_with_parquet_cache(csv_path: str,
+                             read_csv: Callable[[str], pd.DataFrame] = _read_csv_arrow) -> pd.DataFrame:
+    """
+    Read a CSV file through a Parquet cache stored next to it.
+    
+    The first read parses the CSV and writes '<csv_path>.parquet'; later reads
+    load the Parquet file as long as it is newer than the CSV and was written
+    with the current CACHE_VERSION.
+    
+    Args:
+        csv_path: Path to the CSV file
+        read_csv: Function that parses the CSV file on a cache miss
+        
+    Returns:
+        DataFrame with the CSV contents
+    """
+    parquet_path = csv_path + ".parquet"
+    if _is_cache_valid(parquet_path, csv_path):
+        return pd.read_parquet(parquet_path, engine="pyarrow")
+    
+    df = read_csv(csv_path)
+    try:
+        _write_parquet_cache(df, parquet_path)
+    except OSError as e:
+        print(f"Warning: Could not write Parquet cache {parquet_path}: {e}")
+    
+    return df
+
+
+def load_stock_data(tickers: List[str], base_path: str = "../data/stock_data/",
+                    precision: str = 'float32') -> Dict[str, pd.DataFrame]:
     """
     Load stock data for multiple tickers.
     
+    Parsed files are cached as Parquet next to each CSV. Price columns are
+    returned as float32 by default, which halves their memory; pass
+    precision='float64' for full precision.
+    
     Args:
         tickers: List of stock ticker symbols (e.g., ['AAPL', 'MSFT'])
         base_path: Base path to stock data directory
+        precision: Float type for the price columns ('float32' or 'float64')
         
     Returns:
         Dictionary mapping ticker symbols to DataFrames
     """
-    stock_data = {}
+    if precision not in ('float32', 'float64'):
+        raise ValueError(f"precision must be 'float32' or 'float64', got {precision!r}")
     
-    for ticker in tickers:
+    def load_one(ticker: str) -> Optional[Tuple[str, pd.DataFrame]]:
         file_path = os.path.join(base_path, f"{ticker}.csv")
-        if os.path.exists(file_path):
-            df = pd.read_csv(file_path)
-            # Convert Date column to datetime
-            if 'Date' in df.columns:
-                df['Date'] = pd.to_datetime(df['Date'])
-            stock_data[ticker] = df
-        else:
+        if not os.path.exists(file_path):
             print(f"Warning: File not found for {ticker}: {file_path}")
+            return None
+        # The cache keeps full precision so both precisions can be served from it
+        try:
+            df = _read_with_parquet_cache(file_path, _read_stock_csv)
+        except ValueError as e:  # includes pa.ArrowInvalid
+            print(f"Warning: Could not parse data for {ticker}: {file_path}: {e}")
+            return None
+        if precision == 'float32':
+            df = df.astype({column: np.float32 for column in STOCK_PRICE_COLUMNS if column in df.columns})
+        return ticker, df
+    
+    if not tickers:
+        return {}
+    
+    # Read the ticker files concurrently; the Arrow reader releases the GIL while parsing
+    with ThreadPoolExecutor(max_workers=min(32, len(tickers))) as executor:
+        results = executor.map(load_one, tickers)
+    
+    stock_data = dict(result for result in results if result is not None)
     
     return stock_data
 
@@ -38,6 +235,9 @@ def load_news_data(file_path: str = "../data/raw/raw_analyst_ratings.csv",
     """
     Load news data from CSV file.
     
+    The file is parsed by the Arrow CSV reader with categorical publisher/stock
+    columns and cached as Parquet next to the CSV.
+    
     Args:
         file_path: Path to news data CSV file
         drop_unnamed: Whether to drop 'Unnamed: 0' column if present
@@ -45,15 +245,11 @@ def load_news_data(file_path: str = "../data/raw/raw_analyst_ratings.csv",
     Returns:
         DataFrame containing news data
     """
-    news_df = pd.read_csv(file_path, index_col=False)
+    news_df = _read_with_parquet_cache(file_path, _read_news_csv)
     
     if drop_unnamed and 'Unnamed: 0' in news_df.columns:
         news_df.drop(columns=['Unnamed: 0'], inplace=True)
     
-    # Convert date column to datetime if present
-    if 'date' in news_df.columns:
-        news_df['date'] = pd.to_datetime(news_df['date'], utc=True, format='mixed')
-    
     return news_df
 
 
@@ -67,6 +263,13 @@ def get_data_info(df: pd.DataFrame) -> None:
     print(f"Shape: {df.shape}")
     print(f"\nColumns: {df.columns.tolist()}")
     print(f"\nData types:\n{df.dtypes}")
-    print(f"\nMissing values:\n{df.isnull().sum()}")
-    print(f"\nBasic statistics:\n{df.describe()}")
+    # Count missing values one column at a time to avoid a full boolean frame
+    missing = pd.Series({column: df[column].isna().sum() for column in df.columns}, dtype="int64")
+    print(f"\nMissing values:\n{missing}")
+    
+    # Summarize numeric columns only; describing text columns is costly and uninformative
+    if df.select_dtypes(include="number").columns.empty:
+        print("\nBasic statistics:\nNo numeric columns")
+    else:
+        print(f"\nBasic statistics:\n{df.describe(include='number')}")
 
@@ -1,16 +1,52 @@
 """
 Sentiment analysis utilities using VADER.
 """
+import multiprocessing
+import os
+import re
+import string
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import nltk
 from nltk.sentiment.vader import SentimentIntensityAnalyzer
-from typing import Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Optional, Set, Tuple
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; batch classification falls back to NumPy
+    njit = None
 
+try:
+    import vader_rs
+except ImportError:  # vader_rs is optional; only needed for backend="rust"
+    vader_rs = None
+
+
+# Upper (inclusive) edges of the sentiment categories below, in ascending order
+SENTIMENT_BINS = np.array([-0.7, -0.1, 0.1, 0.7])
+SENTIMENT_CATEGORIES = ["very-negative", "negative", "neutral", "positive", "very-positive"]
+SENTIMENT_GROUPS = ["negative", "neutral", "positive"]
+# Maps each category code to its group code
+CATEGORY_TO_GROUP = np.array([0, 0, 1, 2, 2], dtype=np.int8)
+
+# Minimum number of headlines needing full VADER scoring before worker processes are used
+PARALLEL_MIN_HEADLINES = 20_000
+
+# Analyzer used by scoring worker processes (set by _init_scoring_worker)
+_worker_analyzer: Optional[SentimentIntensityAnalyzer] = None
+
+
+@lru_cache(maxsize=1)
 def initialize_sentiment_analyzer() -> SentimentIntensityAnalyzer:
     """
     Initialize and return a VADER sentiment analyzer.
     
+    The analyzer is created once per process and shared by later calls, so
+    the lexicon file is only parsed once.
+    
     Returns:
         SentimentIntensityAnalyzer instance
     """
@@ -24,13 +60,92 @@ def initialize_sentiment_analyzer() -> SentimentIntensityAnalyzer:
     return analyzer
 
 
+def build_lexicon_arrays(analyzer: SentimentIntensityAnalyzer) -> Tuple[Dict[str, int], np.ndarray]:
+    """
+    Convert the VADER lexicon into a token index and a NumPy score array.
+    
+    The score array carries one extra trailing 0.0 entry that unknown tokens
+    are mapped to.
+    
+    Args:
+        analyzer: SentimentIntensityAnalyzer instance
+        
+    Returns:
+        Tuple of (token to index mapping, float64 lexicon scores)
+    """
+    lexicon_index = {word: i for i, word in enumerate(analyzer.lexicon)}
+    # float64 like VADER itself; float32 valences shift some rounded compounds
+    lexicon_scores = np.zeros(len(lexicon_index) + 1, dtype=np.float64)
+    lexicon_scores[:-1] = np.fromiter(analyzer.lexicon.values(), dtype=np.float64, count=len(lexicon_index))
+    return lexicon_index, lexicon_scores
+
+
+def get_rule_trigger_words(analyzer: SentimentIntensityAnalyzer) -> Set[str]:
+    """
+    Get the lowercase words that activate VADER's negation and booster rules.
+    
+    Args:
+        analyzer: SentimentIntensityAnalyzer instance
+        
+    Returns:
+        Set of words that require the full VADER rule set
+    """
+    constants = analyzer.constants
+    trigger_words = set(constants.NEGATE)
+    # Multi-word boosters ('kind of', 'just enough') are caught by their first word
+    trigger_words.update(phrase.split()[0] for phrase in constants.BOOSTER_DICT)
+    trigger_words.update({"but", "least", "no"})
+    return trigger_words
+
+
+def get_rule_trigger_pattern(analyzer: SentimentIntensityAnalyzer) -> str:
+    """
+    Get a regex matching the text that activates VADER's punctuation and idiom rules.
+    
+    Args:
+        analyzer: SentimentIntensityAnalyzer instance
+        
+    Returns:
+        Regex matching '!', '?' or any special-case idiom (case-insensitive use)
+    """
+    # Idiom words may be separated by punctuation, which VADER drops as single-character words
+    idioms = "|".join(
+        r"\W+".join(re.escape(word) for word in idiom.split())
+        for idiom in analyzer.constants.SPECIAL_CASE_IDIOMS
+    )
+    return rf"[!?]|\b(?:{idioms})\b"
+
+
+def get_vader_tokens(headlines: pd.Series, analyzer: SentimentIntensityAnalyzer) -> pd.Series:
+    """
+    Split headlines into the tokens VADER looks up in its lexicon.
+    
+    Mirrors SentiText: split on whitespace, drop single-character tokens and
+    strip one leading or trailing PUNC_LIST entry from otherwise punctuation-free words.
+    
+    Args:
+        headlines: Series of Arrow-backed headline strings with a RangeIndex
+        analyzer: SentimentIntensityAnalyzer instance
+        
+    Returns:
+        Series of tokens indexed by the row position of their headline
+    """
+    punc = "|".join(re.escape(p) for p in sorted(analyzer.constants.PUNC_LIST, key=len, reverse=True))
+    word = f"[^{re.escape(string.punctuation)}]{{2,}}"
+    
+    tokens = headlines.str.split().explode().astype(headlines.dtype).dropna()
+    tokens = tokens[tokens.str.len() > 1]
+    tokens = tokens.str.replace(f"^(?:{punc})({word})$", r"\1", regex=True)
+    return tokens.str.replace(f"^({word})(?:{punc})$", r"\1", regex=True)
+
+
 def calculate_sentiment_scores(text: str, analyzer: Optional[SentimentIntensityAnalyzer] = None) -> Dict[str, float]:
     """
     Calculate sentiment scores for a text using VADER.
     
     Args:
         text: Text to analyze
-        analyzer: SentimentIntensityAnalyzer instance (creates new if None)
+        analyzer: SentimentIntensityAnalyzer instance (uses the shared one if None)
         
     Returns:
         Dictionary with sentiment scores (compound, pos, neu, neg)
@@ -47,7 +162,7 @@ def get_compound_sentiment(text: str, analyzer: Optional[SentimentIntensityAnaly
     
     Args:
         text: Text to analyze
-        analyzer: SentimentIntensityAnalyzer instance (creates new if None)
+        analyzer: SentimentIntensityAnalyzer instance (uses the shared one if None)
         
     Returns:
         Compound sentiment score (-1 to 1)
@@ -56,6 +171,201 @@ def get_compound_sentiment(text: str, analyzer: Optional[SentimentIntensityAnaly
     return scores['compound']
 
 
+def _init_scoring_worker(analyzer: SentimentIntensityAnalyzer) -> None:
+    """
+    Store the analyzer in a scoring worker process (runs once per worker).
+    """
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+
+def _score_chunk(headlines: np.ndarray,
+                 analyzer: Optional[SentimentIntensityAnalyzer] = None) -> np.ndarray:
+    """
+    Score a chunk of headlines with the full VADER rules.
+    """
+    if analyzer is None:
+        analyzer = _worker_analyzer
+    return np.fromiter(
+        (get_compound_sentiment(headline, analyzer) for headline in headlines),
+        dtype=np.float64, count=len(headlines)
+    )
+
+
+def _available_cpus() -> int:
+    """
+    Count the CPUs this process may run on (respects affinity masks and cpusets).
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _score_with_vader(headlines: np.ndarray,
+                      analyzer: SentimentIntensityAnalyzer,
+                      n_jobs: Optional[int] = None) -> np.ndarray:
+    """
+    Score headlines with the full VADER rules, split across worker processes when large.
+    
+    Args:
+        headlines: Array of headline strings
+        analyzer: SentimentIntensityAnalyzer instance
+        n_jobs: Number of worker processes (None for all CPUs, 1 to stay in process)
+        
+    Returns:
+        Array of compound sentiment scores
+    """
+    n_jobs = n_jobs or _available_cpus()
+    if n_jobs == 1 or len(headlines) < PARALLEL_MIN_HEADLINES:
+        return _score_chunk(headlines, analyzer)
+    
+    # Forking a process that may already run threads (e.g. Arrow's pool) can deadlock
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    chunks = np.array_split(headlines, n_jobs)
+    with ProcessPoolExecutor(max_workers=n_jobs,
+                             mp_context=multiprocessing.get_context(start_method),
+                             initializer=_init_scoring_worker,
+                             initargs=(analyzer,)) as executor:
+        return np.concatenate(list(executor.map(_score_chunk, chunks)))
+
+
+def calculate_compound_scores(headlines: pd.Series,
+                              analyzer: Optional[SentimentIntensityAnalyzer] = None,
+                              n_jobs: Optional[int] = None) -> np.ndarray:
+    """
+    Calculate VADER compound scores for a whole column of headlines at once.
+    
+    Headlines are tokenized in one pass and scored by summing lexicon valences
+    looked up from a NumPy array. Headlines that contain '!', '?', an idiom,
+    an ALL-CAPS lexicon word, or a negation/booster word are scored with the
+    full VADER rules instead, spread over worker processes when there are
+    many of them.
+    
+    Args:
+        headlines: Series of headline strings
+        analyzer: SentimentIntensityAnalyzer instance (uses the shared one if None)
+        n_jobs: Number of worker processes for full VADER scoring
+                (None for all CPUs, 1 to stay in process)
+        
+    Returns:
+        Array of compound sentiment scores (-1 to 1)
+    """
+    if n_jobs is not None and n_jobs < 1:
+        raise ValueError(f"n_jobs must be None or a positive integer, got {n_jobs!r}")
+    if analyzer is None:
+        analyzer = initialize_sentiment_analyzer()
+    
+    lexicon_index, lexicon_scores = build_lexicon_arrays(analyzer)
+    trigger_words = get_rule_trigger_words(analyzer)
+    trigger_pattern = get_rule_trigger_pattern(analyzer)
+    # Convert once to Arrow strings so the string operations below run as Arrow kernels
+    arrow_string = pd.ArrowDtype(pa.string())
+    headlines = headlines.astype(arrow_string).reset_index(drop=True)
+    n_rows = len(headlines)
+    
+    # Flatten all tokens into one Series whose index is the row position
+    tokens = get_vader_tokens(headlines, analyzer)
+    row_ids = tokens.index.to_numpy(dtype=np.int64)
+    lowered = tokens.str.lower()
+    
+    # Look up lexicon valences and sum them per headline
+    token_ids = lowered.map(lexicon_index).fillna(len(lexicon_index)).to_numpy(dtype=np.int64)
+    sums = np.bincount(row_ids, weights=lexicon_scores[token_ids], minlength=n_rows)
+    compound = np.round(sums / np.sqrt(sums * sums + 15), 4)
+    
+    # Route headlines that need punctuation, caps, negation or booster rules to VADER
+    needs_rules = (
+        lowered.isin(trigger_words).to_numpy(dtype=bool)
+        | lowered.str.contains("n't", regex=False).to_numpy(dtype=bool)
+        | (tokens.str.isupper().to_numpy(dtype=bool) & (token_ids < len(lexicon_index)))
+    )
+    fallback = np.bincount(row_ids[needs_rules], minlength=n_rows) > 0
+    fallback |= headlines.str.contains(trigger_pattern, case=False, na=False).to_numpy(dtype=bool)
+    
+    # Materialize Python strings once for the rows VADER has to score itself
+    fallback_headlines = headlines.to_numpy(dtype=object)[fallback]
+    compound[fallback] = _score_with_vader(fallback_headlines, analyzer, n_jobs)
+    
+    return compound
+
+
+def _score_with_vader_rs(headlines: pd.Series) -> np.ndarray:
+    """
+    Score headlines in one call to the compiled vader_rs package.
+    
+    Missing headlines are not sent to vader_rs and score 0.0, as they do with
+    calculate_compound_scores.
+    
+    Args:
+        headlines: Series of headline strings
+        
+    Returns:
+        Array of compound sentiment scores
+    """
+    present = headlines.notna().to_numpy(dtype=bool)
+    texts = headlines[present].astype(pd.ArrowDtype(pa.string())).to_list()
+    scores = np.asarray(vader_rs.score_many(texts), dtype=np.float64)
+    if scores.shape != (len(texts),):
+        raise ValueError(
+            f"vader_rs.score_many returned {scores.size} scores for {len(texts)} headlines"
+        )
+    
+    compound = np.zeros(len(headlines), dtype=np.float64)
+    compound[present] = scores
+    return compound
+
+
+def _sentiment_code(compound_score: float) -> int:
+    """
+    Map a compound score to its index in SENTIMENT_CATEGORIES.
+    """
+    if compound_score >= 0.7:
+        return 4
+    elif compound_score >= 0.1:
+        return 3
+    elif compound_score >= -0.1:
+        return 2
+    elif compound_score >= -0.7:
+        return 1
+    else:
+        return 0
+
+
+if njit is not None:
+    # Compile a separate copy so scalar classify_sentiment stays plain Python
+    _jit_sentiment_code = njit(_sentiment_code)
+    
+    @njit(parallel=True)
+    def _classify_codes(scores: np.ndarray) -> np.ndarray:
+        codes = np.empty(scores.shape[0], dtype=np.int8)
+        for i in prange(scores.shape[0]):
+            codes[i] = _jit_sentiment_code(scores[i])
+        return codes
+else:
+    def _classify_codes(scores: np.ndarray) -> np.ndarray:
+        codes = np.searchsorted(SENTIMENT_BINS, scores, side='right').astype(np.int8)
+        codes[np.isnan(scores)] = 0
+        return codes
+
+
+def classify_sentiment_batch(scores: np.ndarray) -> np.ndarray:
+    """
+    Classify an array of compound scores into category codes.
+    
+    Uses the same left-inclusive thresholds as classify_sentiment, so 0.1
+    is positive here while add_sentiment_analysis (right-inclusive bins,
+    like pd.cut) labels 0.1 neutral. The loop is compiled with numba and
+    runs across all cores when numba is installed.
+    
+    Args:
+        scores: Array of VADER compound sentiment scores
+        
+    Returns:
+        int8 array of indices into SENTIMENT_CATEGORIES
+    """
+    return _classify_codes(np.ascontiguousarray(scores, dtype=np.float64))
+
+
 def classify_sentiment(compound_score: float) -> str:
     """
     Classify sentiment based on compound score.
@@ -73,55 +383,70 @@ def classify_sentiment(compound_score: float) -> str:
     Returns:
         Sentiment category string
     """
-    if compound_score >= 0.7:
-        return "very-positive"
-    elif compound_score >= 0.1:
-        return "positive"
-    elif compound_score >= -0.1:
-        return "neutral"
-    elif compound_score >= -0.7:
-        return "negative"
-    else:
-        return "very-negative"
+    return SENTIMENT_CATEGORIES[_sentiment_code(compound_score)]
+
+
+def get_sentiment_categories(scores: np.ndarray) -> Tuple[pd.Categorical, pd.Categorical]:
+    """
+    Bucket compound scores into sentiment categories and groups.
+    
+    Bin edges are right-inclusive like pd.cut over [-1, -0.7, -0.1, 0.1, 0.7, 1],
+    except that a score of exactly -1.0 is very-negative instead of missing.
+    
+    Args:
+        scores: Array of VADER compound sentiment scores
+        
+    Returns:
+        Tuple of (SENTIMENT_CATEGORIES Categorical, SENTIMENT_GROUPS Categorical)
+    """
+    category_codes = np.searchsorted(SENTIMENT_BINS, scores).astype(np.int8)
+    categories = pd.Categorical.from_codes(category_codes, categories=SENTIMENT_CATEGORIES)
+    groups = pd.Categorical.from_codes(CATEGORY_TO_GROUP[category_codes], categories=SENTIMENT_GROUPS)
+    return categories, groups
 
 
 def add_sentiment_analysis(df: pd.DataFrame, 
                           headline_column: str = 'headline',
-                          analyzer: Optional[SentimentIntensityAnalyzer] = None) -> pd.DataFrame:
+                          analyzer: Optional[SentimentIntensityAnalyzer] = None,
+                          n_jobs: Optional[int] = None,
+                          backend: str = 'python') -> pd.DataFrame:
     """
     Add sentiment analysis columns to a DataFrame.
     
     Args:
         df: DataFrame containing headlines
         headline_column: Name of the headline column
-        analyzer: SentimentIntensityAnalyzer instance (creates new if None)
+        analyzer: SentimentIntensityAnalyzer instance (uses the shared one if None)
+        n_jobs: Number of worker processes for full VADER scoring
+                (None for all CPUs, 1 to stay in process)
+        backend: 'python' for NLTK's VADER, or 'rust' to score every headline
+                 in one call to the compiled vader_rs package (optional dependency;
+                 analyzer and n_jobs are ignored)
         
     Returns:
         DataFrame with added sentiment columns
     """
-    df = df.copy()
+    if backend not in ('python', 'rust'):
+        raise ValueError(f"backend must be 'python' or 'rust', got {backend!r}")
+    if n_jobs is not None and n_jobs < 1:
+        raise ValueError(f"n_jobs must be None or a positive integer, got {n_jobs!r}")
+    if backend == 'rust' and vader_rs is None:
+        raise ImportError("backend='rust' requires the optional vader_rs package")
     
-    if analyzer is None:
-        analyzer = initialize_sentiment_analyzer()
+    df = df.copy(deep=False)
     
     # Calculate compound sentiment scores
-    df['headline_sentiment'] = df[headline_column].apply(
-        lambda headline: get_compound_sentiment(headline, analyzer)
-    )
+    if backend == 'rust':
+        df['headline_sentiment'] = _score_with_vader_rs(df[headline_column])
+    else:
+        if analyzer is None:
+            analyzer = initialize_sentiment_analyzer()
+        df['headline_sentiment'] = calculate_compound_scores(df[headline_column], analyzer, n_jobs)
     
-    # Classify sentiments
-    df['sentiment_category'] = pd.cut(
-        x=df['headline_sentiment'],
-        bins=[-1, -0.7, -0.1, 0.1, 0.7, 1],
-        labels=["very-negative", "negative", "neutral", "positive", "very-positive"],
-        precision=3
+    # Classify sentiments and combine very-positive/positive and very-negative/negative into groups
+    df['sentiment_category'], df['sentiment_group'] = get_sentiment_categories(
+        df['headline_sentiment'].to_numpy()
     )
     
-    # Add sentiment groups (combine very-positive/positive and very-negative/negative)
-    df['sentiment_group'] = df['sentiment_category'].astype(str).replace({
-        'very-positive': 'positive',
-        'very-negative': 'negative'
-    })
-    
     return df
 
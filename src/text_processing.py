@@ -1,13 +1,20 @@
 """
 Text processing utilities for news headlines.
 """
+import re
 import string
+import numpy as np
 import pandas as pd
 import nltk
-from typing import List, Tuple, Optional
+from typing import FrozenSet, List, Tuple, Optional
 from collections import Counter
-from nltk.collocations import TrigramCollocationFinder
-from nltk.metrics import TrigramAssocMeasures
+from functools import lru_cache
+from itertools import chain
+
+
+PUNCTUATION = frozenset(string.punctuation)
+# Runs of Unicode letters (word characters other than digits and underscore)
+TOKEN_PATTERN = re.compile(r"[^\W\d_]+")
 
 
 def download_nltk_data(packages: List[str] = None) -> None:
@@ -23,57 +30,94 @@ def download_nltk_data(packages: List[str] = None) -> None:
     nltk.download(packages, quiet=True)
 
 
+@lru_cache(maxsize=1)
+def _get_stop_words() -> FrozenSet[str]:
+    """
+    Load the English stop words once per process.
+    
+    Returns:
+        Frozen set of English stop words
+    """
+    try:
+        return frozenset(nltk.corpus.stopwords.words('english'))
+    except LookupError:
+        download_nltk_data(["stopwords", "punkt_tab"])
+        return frozenset(nltk.corpus.stopwords.words('english'))
+
+
+def _tokenize(headline: str,
+              remove_stopwords: bool,
+              remove_punctuation: bool,
+              lowercase: bool,
+              use_nltk_tokenizer: bool) -> List[str]:
+    """
+    Tokenize a headline without caching (see get_tokens for the arguments).
+    """
+    if lowercase:
+        headline = headline.lower()
+    
+    if use_nltk_tokenizer:
+        try:
+            tokens = nltk.word_tokenize(headline)
+        except LookupError:
+            download_nltk_data(["punkt_tab"])
+            tokens = nltk.word_tokenize(headline)
+        
+        result = []
+        for token in tokens:
+            token = token.strip()
+            if remove_punctuation and token in PUNCTUATION:
+                continue
+            if not token.isalpha():
+                continue
+            result.append(token)
+        tokens = result
+    else:
+        tokens = TOKEN_PATTERN.findall(headline)
+    
+    if remove_stopwords:
+        stop_words = _get_stop_words()
+        tokens = [token for token in tokens if token not in stop_words]
+    
+    return tokens
+
+
+@lru_cache(maxsize=200_000)
+def _get_default_tokens(headline: str) -> Tuple[str, ...]:
+    """
+    Tokenize a headline with the default get_tokens options, caching the result.
+    """
+    return tuple(_tokenize(headline, True, True, True, False))
+
+
 def get_tokens(headline: str, 
                remove_stopwords: bool = True,
                remove_punctuation: bool = True,
-               lowercase: bool = True) -> List[str]:
+               lowercase: bool = True,
+               use_nltk_tokenizer: bool = False) -> List[str]:
     """
     Tokenize a headline and return cleaned tokens.
     
+    By default words are runs of letters, including non-ASCII letters such
+    as 'é', found with a precompiled regex, so tokens never contain
+    punctuation or digits. Set use_nltk_tokenizer to split with
+    nltk.word_tokenize instead. Results for the default options are
+    cached, since news corpora repeat many headlines.
+    
     Args:
         headline: The headline text to tokenize
         remove_stopwords: Whether to remove stop words
-        remove_punctuation: Whether to remove punctuation
+        remove_punctuation: Whether to remove punctuation (nltk tokenizer only)
         lowercase: Whether to convert to lowercase
+        use_nltk_tokenizer: Whether to tokenize with nltk.word_tokenize
         
     Returns:
         List of cleaned tokens
     """
-    # Download required NLTK data if not already present
-    try:
-        stop_words = set(nltk.corpus.stopwords.words('english'))
-    except LookupError:
-        download_nltk_data(["stopwords", "punkt_tab"])
-        stop_words = set(nltk.corpus.stopwords.words('english'))
-    
-    punctuation = set(string.punctuation)
-    
-    if lowercase:
-        headline = headline.lower()
-    
-    try:
-        tokens = nltk.word_tokenize(headline)
-    except LookupError:
-        download_nltk_data(["punkt_tab"])
-        tokens = nltk.word_tokenize(headline)
-    
-    result = []
-    for token in tokens:
-        token = token.strip()
-        if not token:
-            continue
-        
-        # Filter conditions
-        if remove_stopwords and token in stop_words:
-            continue
-        if remove_punctuation and token in punctuation:
-            continue
-        if not token.isalpha():
-            continue
-        
-        result.append(token)
+    if remove_stopwords and remove_punctuation and lowercase and not use_nltk_tokenizer:
+        return list(_get_default_tokens(headline))
     
-    return result
+    return _tokenize(headline, remove_stopwords, remove_punctuation, lowercase, use_nltk_tokenizer)
 
 
 def get_word_frequencies(headlines: List[str], top_n: Optional[int] = None) -> List[Tuple[str, int]]:
@@ -87,20 +131,34 @@ def get_word_frequencies(headlines: List[str], top_n: Optional[int] = None) -> L
     Returns:
         List of (word, count) tuples, sorted by frequency
     """
-    # Tokenize all headlines
-    all_tokens = []
-    for headline in headlines:
-        tokens = get_tokens(headline)
-        all_tokens.extend(tokens)
+    # Tokenize all headlines in one pass (same tokens as get_tokens with defaults)
+    token_lists = pd.Series(headlines, dtype="string").str.lower().str.findall(TOKEN_PATTERN)
     
-    # Count frequencies
-    word_counts = Counter(all_tokens)
+    # Count frequencies, skipping stop words
+    stop_words = _get_stop_words()
+    word_counts = Counter(
+        token for token in chain.from_iterable(token_lists.dropna()) if token not in stop_words
+    )
     
     if top_n:
         return word_counts.most_common(top_n)
     return word_counts.most_common()
 
 
+def _encode_words(words: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encode words as int32 ids numbered in sorted word order.
+    
+    Args:
+        words: List of words
+        
+    Returns:
+        Tuple of (word ids, vocabulary array indexed by id)
+    """
+    word_ids, vocab = pd.factorize(np.asarray(words, dtype=object), sort=True)
+    return word_ids.astype(np.int32), vocab
+
+
 def get_trigrams(headlines: List[List[str]], 
                  freq_filter: int = 20, 
                  top_n: int = 50) -> List[Tuple[str, str, str]]:
@@ -117,17 +175,32 @@ def get_trigrams(headlines: List[List[str]],
     """
     # Flatten all tokenized words into a single list
     all_words = [word for tokens in headlines for word in tokens]
-    
-    # Create a TrigramCollocationFinder
-    finder = TrigramCollocationFinder.from_words(all_words)
-    
-    # Apply frequency filter to remove rare trigrams
-    finder.apply_freq_filter(freq_filter)
-    
-    # Get the top N trigrams based on Pointwise Mutual Information (PMI)
-    significant_trigrams = finder.nbest(TrigramAssocMeasures.pmi, top_n)
-    
-    return significant_trigrams
+    if len(all_words) < 3:
+        return []
+    
+    # Encode words as integer ids so counting works on arrays instead of strings
+    word_ids, vocab = _encode_words(all_words)
+    word_counts = np.bincount(word_ids)
+    
+    # Count every contiguous trigram and apply the frequency filter
+    trigrams, trigram_counts = np.unique(
+        np.stack([word_ids[:-2], word_ids[1:-1], word_ids[2:]], axis=1),
+        axis=0, return_counts=True
+    )
+    keep = trigram_counts >= freq_filter
+    trigrams, trigram_counts = trigrams[keep], trigram_counts[keep]
+    
+    # Pointwise Mutual Information, as in nltk's TrigramAssocMeasures.pmi
+    n_words = float(len(word_ids))
+    pmi = (
+        np.log2(trigram_counts * n_words ** 2)
+        - np.log2(word_counts[trigrams].astype(np.float64).prod(axis=1))
+    )
+    
+    # Highest PMI first; ties are broken alphabetically (ids follow sorted word order)
+    order = np.lexsort((trigrams[:, 2], trigrams[:, 1], trigrams[:, 0], -pmi))[:top_n]
+    
+    return [tuple(vocab[trigram]) for trigram in trigrams[order]]
 
 
 def add_headline_length(df: pd.DataFrame, headline_column: str = 'headline') -> pd.DataFrame:
@@ -141,8 +214,10 @@ def add_headline_length(df: pd.DataFrame, headline_column: str = 'headline') ->
     Returns:
         DataFrame with added 'headline_length' column
     """
-    df = df.copy()
-    df[headline_column] = df[headline_column].astype(str)
-    df['headline_length'] = df[headline_column].apply(len)
+    df = df.copy(deep=False)
+    # Arrow-backed strings let str.len run as a native kernel; missing headlines count as 0
+    headlines = df[headline_column].astype("string[pyarrow]")
+    df[headline_column] = headlines
+    df['headline_length'] = headlines.str.len().fillna(0).astype("int32")
     return df
 
@@ -0,0 +1,92 @@
+import os
+
+import pandas as pd
+from pyarrow import parquet as pq
+
+from src import data_loader as dl
+
+
+def _write_csv(path, text):
+    path.write_text(text)
+    return str(path)
+
+
+def test_parquet_cache_is_versioned(tmp_path):
+    csv_path = _write_csv(tmp_path / "prices.csv", "a,b\n1,x\n2,y\n")
+    first = dl._read_with_parquet_cache(csv_path)
+    metadata = pq.read_schema(csv_path + ".parquet").metadata
+    assert metadata[dl.CACHE_VERSION_KEY] == dl.CACHE_VERSION.encode()
+    pd.testing.assert_frame_equal(dl._read_with_parquet_cache(csv_path), first)
+    assert [name for name in os.listdir(tmp_path) if name.endswith(".tmp")] == []
+
+
+def test_parquet_cache_rebuilt_on_version_mismatch(tmp_path, monkeypatch):
+    csv_path = _write_csv(tmp_path / "prices.csv", "a\n1\n")
+    dl._read_with_parquet_cache(csv_path)
+    monkeypatch.setattr(dl, "CACHE_VERSION", "old")
+    assert not dl._is_cache_valid(csv_path + ".parquet", csv_path)
+
+
+def test_parquet_cache_rebuilt_when_corrupt(tmp_path):
+    csv_path = _write_csv(tmp_path / "prices.csv", "a\n1\n")
+    (tmp_path / "prices.csv.parquet").write_bytes(b"not parquet")
+    df = dl._read_with_parquet_cache(csv_path)
+    assert df["a"].tolist() == [1]
+    assert dl._is_cache_valid(csv_path + ".parquet", csv_path)
+
+
+def test_load_stock_data_typed_columns(tmp_path):
+    _write_csv(tmp_path / "AAPL.csv", "Date,Open,Close,Volume\n2020-01-02,1.5,2.5,100\n")
+    df = dl.load_stock_data(["AAPL"], str(tmp_path))["AAPL"]
+    assert df["Date"].dtype == "datetime64[ns]"
+    assert df["Open"].dtype == "float32"
+    assert df["Volume"].dtype == "int64"
+
+
+def test_load_stock_data_offset_dates_and_float_volume(tmp_path):
+    _write_csv(
+        tmp_path / "MSFT.csv",
+        "Date,Open,Close,Volume\n"
+        "2020-01-02 00:00:00-05:00,1.5,2.5,1.0e6\n"
+        "2020-07-02 00:00:00-04:00,2.0,3.0,300\n",
+    )
+    _write_csv(tmp_path / "AAPL.csv", "Date,Open,Close,Volume\n2020-01-02,1.5,2.5,100\n")
+    stock_data = dl.load_stock_data(["MSFT", "AAPL"], str(tmp_path))
+    assert set(stock_data) == {"MSFT", "AAPL"}
+    df = stock_data["MSFT"]
+    assert df["Date"].tolist() == [
+        pd.Timestamp("2020-01-02 05:00", tz="UTC"), pd.Timestamp("2020-07-02 04:00", tz="UTC"),
+    ]
+    assert df["Volume"].tolist() == [1e6, 300]
+
+
+def test_load_stock_data_skips_unparseable_file(tmp_path, capsys):
+    _write_csv(tmp_path / "BAD.csv", "Date,Open\n2020-01-02,not a price\n")
+    _write_csv(tmp_path / "AAPL.csv", "Date,Open\n2020-01-02,1.5\n")
+    assert list(dl.load_stock_data(["BAD", "AAPL"], str(tmp_path))) == ["AAPL"]
+    assert "Could not parse data for BAD" in capsys.readouterr().out
+
+
+def test_load_news_data_quoted_newlines(tmp_path):
+    csv_path = _write_csv(
+        tmp_path / "news.csv",
+        ',headline,url,publisher,date,stock\n'
+        '0,"Line one\nline two",u,p,2020-06-05 10:30:54-04:00,A\n'
+        '1,Plain,u,p,2020-06-05 10:30:54-04:00,A\n',
+    )
+    df = dl.load_news_data(csv_path)
+    assert df["headline"].tolist() == ["Line one\nline two", "Plain"]
+
+
+def test_load_news_data_empty_fields_are_missing(tmp_path):
+    csv_path = _write_csv(
+        tmp_path / "news.csv",
+        ',headline,url,publisher,date,stock\n'
+        '0,,u,,2020-06-05 10:30:54-04:00,A\n'
+        '1,Good,,p,2020-06-05 10:30:54-04:00,\n'
+        '2,,u,p,2020-06-05 10:30:54-04:00,A\n',
+    )
+    df = dl.load_news_data(csv_path)
+    expected = pd.read_csv(csv_path, index_col=0).isna().sum()
+    pd.testing.assert_series_equal(df.isna().sum(), expected)
+    assert df["publisher"].cat.categories.tolist() == ["p"]
@@ -0,0 +1,48 @@
+import pandas as pd
+
+from src.publisher_analysis import (
+    add_organization_column, extract_organization_from_email, get_top_publishers,
+)
+
+
+PUBLISHERS = [
+    "analyst@benzinga.com",
+    "a@b@c.com",
+    "name@sub.domain.org",
+    "trailing@",
+    "@leading.com",
+    "dot@.com",
+    "nodomain@host",
+    "Lisa Levin",
+    "",
+    None,
+]
+
+
+def _expected(publishers):
+    return [
+        extract_organization_from_email(p) if isinstance(p, str) and "@" in p else None
+        for p in publishers
+    ]
+
+
+def test_organization_column_matches_email_extraction():
+    df = pd.DataFrame({"publisher": PUBLISHERS})
+    result = add_organization_column(df)["organization"]
+    assert [None if pd.isna(v) else v for v in result] == _expected(PUBLISHERS)
+
+
+def test_organization_column_from_categorical_publishers():
+    df = pd.DataFrame({"publisher": pd.Categorical(PUBLISHERS + ["unused@x.com"])[:len(PUBLISHERS)]})
+    result = add_organization_column(df)["organization"]
+    assert [None if pd.isna(v) else v for v in result] == _expected(PUBLISHERS)
+
+
+def test_top_publishers_skip_unused_categories():
+    df = pd.DataFrame({
+        "publisher": pd.Categorical(["a", "b", "a", "c"], categories=["a", "b", "c", "d"]),
+        "headline": ["x", "y", "z", None],
+    })
+    result = get_top_publishers(df[df["publisher"] != "b"], top_n=10)
+    assert result["headline"].to_dict() == {"a": 2}
+    assert get_top_publishers(df, top_n=10)["headline"].to_dict() == {"a": 2, "b": 1}
@@ -0,0 +1,150 @@
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src import sentiment_analysis as sa
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    try:
+        return sa.initialize_sentiment_analyzer()
+    except LookupError:
+        pytest.skip("VADER lexicon is not available")
+
+
+PARITY_HEADLINES = [
+    "Amazon's Growth,Profit Surge",
+    "Stock (Good) News",
+    "Win/Loss ratio improves",
+    "Shares Gain--Investors Cheer",
+    "Buy/Sell ratings: good/bad outlook",
+    "Analysts say gr8 quarter",
+    "Investors <3 the new chip",
+    "Earnings beat :) shares up",
+    "Bank fined 86 million",
+    "143 reasons to buy",
+    '"great" results, sad outlook.',
+    "Profits fall; losses widen...",
+    "Top gains: good, great, best",
+    "",
+    "   ",
+    # Rounded differently when valences were summed as float32
+    "unconcerned riot opportunely stampede justice",
+    "murderously joys toughies frauds pleasurable",
+    "obnoxiously perfected devastates uneasier adoringly",
+]
+
+
+def _expected(headlines, analyzer):
+    return np.array([analyzer.polarity_scores(h)["compound"] for h in headlines])
+
+
+def test_compound_scores_match_vader(analyzer):
+    scores = sa.calculate_compound_scores(pd.Series(PARITY_HEADLINES), analyzer, n_jobs=1)
+    np.testing.assert_array_equal(scores, _expected(PARITY_HEADLINES, analyzer))
+
+
+def test_compound_scores_match_vader_random(analyzer):
+    rng = random.Random(0)
+    words = rng.sample(sorted(analyzer.lexicon), 300) + ["market", "stock", "shares", "gr8", ":)", "<3", "86"]
+    affixes = ["", "", "", ",", ".", "(", ")", ":", '"', "'s", "--", "/"]
+
+    def token():
+        word = rng.choice(words)
+        if rng.random() < 0.3:
+            word = rng.choice(affixes) + word + rng.choice(affixes)
+        if rng.random() < 0.1:
+            word = word + "/" + rng.choice(words)
+        return word
+
+    headlines = [" ".join(token() for _ in range(rng.randint(1, 12))) for _ in range(2000)]
+    scores = sa.calculate_compound_scores(pd.Series(headlines), analyzer, n_jobs=1)
+    np.testing.assert_array_equal(scores, _expected(headlines, analyzer))
+
+
+def test_sentiment_categories_boundaries():
+    scores = np.array([-1.0, -0.7, -0.6999, -0.1, -0.0999, 0.0, 0.1, 0.1001, 0.7, 0.7001, 1.0])
+    categories, groups = sa.get_sentiment_categories(scores)
+    assert list(categories) == [
+        "very-negative", "very-negative", "negative", "negative", "neutral", "neutral",
+        "neutral", "positive", "positive", "very-positive", "very-positive",
+    ]
+    assert list(groups) == [
+        "negative", "negative", "negative", "negative", "neutral", "neutral",
+        "neutral", "positive", "positive", "positive", "positive",
+    ]
+
+
+def test_sentiment_categories_match_pd_cut():
+    scores = np.random.default_rng(0).uniform(-1, 1, 1000).round(4)
+    categories, _ = sa.get_sentiment_categories(scores)
+    expected = pd.cut(scores, bins=[-1, -0.7, -0.1, 0.1, 0.7, 1], labels=sa.SENTIMENT_CATEGORIES)
+    assert list(categories) == list(expected)
+
+
+def test_classify_sentiment_batch_matches_scalar():
+    scores = np.array([-1.0, -0.7, -0.1, 0.0, 0.1, 0.7, 1.0, np.nan])
+    codes = sa.classify_sentiment_batch(scores)
+    assert [sa.SENTIMENT_CATEGORIES[c] for c in codes] == [sa.classify_sentiment(s) for s in scores]
+    assert sa.classify_sentiment(0.1) == "positive"
+
+
+def test_classify_sentiment_rejects_non_numbers():
+    with pytest.raises(TypeError):
+        sa.classify_sentiment("0.5")
+
+
+def test_parallel_scoring_matches_serial(analyzer, monkeypatch):
+    monkeypatch.setattr(sa, "PARALLEL_MIN_HEADLINES", 10)
+    headlines = pd.Series(PARITY_HEADLINES * 4 + ["Not good!", "Very bad news?", "Shares don't fall"] * 5)
+    serial = sa.calculate_compound_scores(headlines, analyzer, n_jobs=1)
+    parallel = sa.calculate_compound_scores(headlines, analyzer, n_jobs=2)
+    np.testing.assert_array_equal(parallel, serial)
+
+
+class _FakeVaderRs:
+    def __init__(self, analyzer, drop_last=False):
+        self.analyzer = analyzer
+        self.drop_last = drop_last
+        self.calls = []
+
+    def score_many(self, texts):
+        self.calls.append(texts)
+        scores = [self.analyzer.polarity_scores(text)["compound"] for text in texts]
+        return scores[:-1] if self.drop_last else scores
+
+
+def test_rust_backend_scores_every_row(analyzer, monkeypatch):
+    fake = _FakeVaderRs(analyzer)
+    monkeypatch.setattr(sa, "vader_rs", fake)
+    df = pd.DataFrame({"headline": ["Good results", None, "Terrible loss"]})
+    result = sa.add_sentiment_analysis(df, backend="rust")
+    assert len(result) == len(df)
+    assert result["headline_sentiment"].dtype == np.float64
+    assert fake.calls == [["Good results", "Terrible loss"]]
+    expected = sa.add_sentiment_analysis(df, analyzer=analyzer, n_jobs=1)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_rust_backend_rejects_wrong_length(analyzer, monkeypatch):
+    monkeypatch.setattr(sa, "vader_rs", _FakeVaderRs(analyzer, drop_last=True))
+    with pytest.raises(ValueError):
+        sa.add_sentiment_analysis(pd.DataFrame({"headline": ["Good", "Bad"]}), backend="rust")
+
+
+def test_rust_backend_requires_vader_rs(monkeypatch):
+    monkeypatch.setattr(sa, "vader_rs", None)
+    with pytest.raises(ImportError):
+        sa.add_sentiment_analysis(pd.DataFrame({"headline": ["Good"]}), backend="rust")
+
+
+@pytest.mark.parametrize("n_jobs", [0, -1])
+def test_invalid_n_jobs_rejected(n_jobs):
+    headlines = pd.Series(["Good news"])
+    with pytest.raises(ValueError, match="n_jobs"):
+        sa.calculate_compound_scores(headlines, n_jobs=n_jobs)
+    with pytest.raises(ValueError, match="n_jobs"):
+        sa.add_sentiment_analysis(pd.DataFrame({"headline": headlines}), n_jobs=n_jobs)
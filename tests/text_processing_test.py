@@ -0,0 +1,37 @@
+import random
+
+import pytest
+from nltk.collocations import TrigramAssocMeasures, TrigramCollocationFinder
+
+from src.text_processing import get_tokens, get_trigrams, get_word_frequencies
+
+
+def test_tokens_keep_non_ascii_letters():
+    assert get_tokens("Nestlé café in Zürich gains 5% on Q3_results") == [
+        "nestlé", "café", "zürich", "gains", "q", "results",
+    ]
+
+
+def test_word_frequencies_match_get_tokens():
+    headlines = ["Nestlé café opens", "NESTLÉ Café, São Paulo", "Stocks up 3%", None]
+    expected = {}
+    for headline in filter(None, headlines):
+        for token in get_tokens(headline):
+            expected[token] = expected.get(token, 0) + 1
+    assert dict(get_word_frequencies(headlines)) == expected
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_trigrams_match_nltk_collocations(seed):
+    rng = random.Random(seed)
+    vocab = [f"w{i}" for i in range(rng.randint(5, 40))]
+    headlines = [
+        [rng.choice(vocab) for _ in range(rng.randint(0, 15))] for _ in range(rng.randint(50, 400))
+    ]
+    freq_filter = rng.randint(1, 4)
+    
+    finder = TrigramCollocationFinder.from_words([word for tokens in headlines for word in tokens])
+    finder.apply_freq_filter(freq_filter)
+    expected = finder.nbest(TrigramAssocMeasures.pmi, 30)
+    
+    assert get_trigrams(headlines, freq_filter=freq_filter, top_n=30) == expected